@@ -5,7 +5,8 @@ a = Analysis(
     ['system_monitor.py'],
     pathex=[],
     binaries=[],
-    datas=[('ironman/cache', 'ironman/cache')],
+    datas=[('ironman/cache/*.jpg', 'ironman/cache'),
+           ('ironman/cache/code_lines.txt', 'ironman/cache')],
     hiddenimports=['PIL._tkinter_finder', 'psutil'],
     hookspath=[],
     hooksconfig={},
@@ -25,7 +25,7 @@ def main():
 
     # Check if pre-rendered frames exist
     cache_dir = os.path.join(project_dir, 'ironman', 'cache')
-    frames_exist = os.path.exists(os.path.join(cache_dir, 'frame_000.png'))
+    frames_exist = os.path.exists(os.path.join(cache_dir, 'frame_000.jpg'))
 
     if not frames_exist:
         print("Pre-rendered frames not found. Generating...")
@@ -36,32 +36,42 @@ def main():
 
     if system == 'Windows':
         icon_option = []  # Add --icon=icon.ico if you have an icon
-        name = 'JarvisMonitor.exe'
     elif system == 'Darwin':
         icon_option = []  # Add --icon=icon.icns if you have an icon
-        name = 'JarvisMonitor'
     else:
         icon_option = []
-        name = 'JarvisMonitor'
+
+    # Generate the spec once; later builds reuse it (and PyInstaller's
+    # cached analysis in build/) instead of re-deriving it from CLI flags
+    spec_file = os.path.join(project_dir, 'JarvisMonitor.spec')
+    if not os.path.exists(spec_file):
+        makespec_cmd = [
+            sys.executable, '-m', 'PyInstaller.utils.cliutils.makespec',
+            '--name=JarvisMonitor',
+            '--onedir',  # Create a directory (more reliable than onefile for tkinter)
+            '--windowed',  # No console window
+            # Add data files
+            '--add-data', f'ironman/cache/*.jpg{os.pathsep}ironman/cache',
+            '--add-data', f'ironman/cache/code_lines.txt{os.pathsep}ironman/cache',
+            # Hidden imports that PyInstaller might miss
+            '--hidden-import=PIL._tkinter_finder',
+            '--hidden-import=psutil',
+            # Main script
+            'system_monitor.py',
+        ]
+        makespec_cmd.extend(icon_option)
+
+        print("Generating JarvisMonitor.spec...")
+        subprocess.check_call(makespec_cmd)
 
     # Build command
     cmd = [
         sys.executable, '-m', 'PyInstaller',
-        '--name=JarvisMonitor',
-        '--onedir',  # Create a directory (more reliable than onefile for tkinter)
-        '--windowed',  # No console window
         '--noconfirm',  # Overwrite without asking
-        # Add data files
-        '--add-data', f'ironman/cache{os.pathsep}ironman/cache',
-        # Hidden imports that PyInstaller might miss
-        '--hidden-import=PIL._tkinter_finder',
-        '--hidden-import=psutil',
-        # Main script
-        'system_monitor.py',
+        '--log-level=WARN',  # Skip per-module INFO tracing
+        spec_file,
     ]
 
-    cmd.extend(icon_option)
-
     print(f"Building for {system}...")
     print(f"Command: {' '.join(cmd)}")
 
@@ -76,8 +86,7 @@ def main():
     print(f"{'='*50}")
 
     if system == 'Darwin':
-        print("\nOn macOS, you can also create an .app bundle by running:")
-        print("  pyinstaller --windowed --onedir --name=JarvisMonitor system_monitor.py")
+        print(f"\nRun: {os.path.join(project_dir, 'dist', 'JarvisMonitor.app')}")
     elif system == 'Windows':
         print(f"\nRun: {os.path.join(dist_dir, 'JarvisMonitor.exe')}")
     else:
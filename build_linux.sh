@@ -38,7 +38,7 @@ pip install -r requirements.txt
 pip install pyinstaller
 
 # Check if pre-rendered frames exist
-if [ ! -f "ironman/cache/frame_000.png" ]; then
+if [ ! -f "ironman/cache/frame_000.jpg" ]; then
     echo "Pre-rendered frames not found. Generating..."
     python prerender_model.py
 fi
@@ -50,7 +50,8 @@ pyinstaller \
     --onedir \
     --windowed \
     --noconfirm \
-    --add-data "ironman/cache:ironman/cache" \
+    --add-data "ironman/cache/*.jpg:ironman/cache" \
+    --add-data "ironman/cache/code_lines.txt:ironman/cache" \
     --hidden-import=PIL._tkinter_finder \
     --hidden-import=psutil \
     system_monitor.py
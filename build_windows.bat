@@ -29,7 +29,7 @@ pip install -r requirements.txt
 pip install pyinstaller
 
 REM Check if pre-rendered frames exist
-if not exist "ironman\cache\frame_000.png" (
+if not exist "ironman\cache\frame_000.jpg" (
     echo Pre-rendered frames not found. Generating...
     python prerender_model.py
 )
@@ -41,7 +41,8 @@ pyinstaller ^
     --onedir ^
     --windowed ^
     --noconfirm ^
-    --add-data "ironman\cache;ironman\cache" ^
+    --add-data "ironman\cache\*.jpg;ironman\cache" ^
+    --add-data "ironman\cache\code_lines.txt;ironman\cache" ^
     --hidden-import=PIL._tkinter_finder ^
     --hidden-import=psutil ^
     system_monitor.py
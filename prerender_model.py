@@ -4,21 +4,26 @@ Pre-render Iron Man model rotation frames for fast playback
 """
 
 import os
-import math
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
-from stl import mesh
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend for rendering
-from matplotlib.figure import Figure
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from PIL import Image, ImageColor, ImageDraw
 
 # Settings
 FRAME_COUNT = 120  # Number of frames for full rotation (3 degrees per frame)
 FRAME_SIZE = (450, 450)  # Match the 3D panel size
+JPEG_QUALITY = 92  # Frames are opaque, JPEG encodes far faster than PNG
 CACHE_DIR = os.path.join(os.path.dirname(__file__), 'ironman', 'cache')
 BG_COLOR = '#0a0a12'
 FACE_COLOR = '#0a1520'
 EDGE_COLOR = '#00d4ff'
+MESH_ALPHA = 0.9
+SUPERSAMPLE = 2  # Rasterize at 2x and downsample for anti-aliased edges
+FACE_RGBA = (*ImageColor.getrgb(FACE_COLOR), round(MESH_ALPHA * 255))
+EDGE_RGBA = (*ImageColor.getrgb(EDGE_COLOR), round(MESH_ALPHA * 255))
+
+# Per-process render inputs, set up once by _init_worker
+_worker_scene = None
 
 def load_and_prepare_model():
     """Load STL and prepare transformed faces"""
@@ -28,60 +33,40 @@ def load_and_prepare_model():
         print(f"Model not found: {model_path}")
         return None
 
-    print(f"Loading model from {model_path}...")
-    model_mesh = mesh.Mesh.from_file(model_path)
-    vectors = model_mesh.vectors.copy()
-
-    # Center the model
-    all_points = vectors.reshape(-1, 3)
-    center = all_points.mean(axis=0)
-    vectors = vectors - center
+    from stl import mesh  # Deferred: only needed when frames are rendered
 
-    # Transform orientation: STL Z-up to display Y-up
-    transformed = np.zeros_like(vectors)
+    print(f"Loading model from {model_path}...")
+    # Normals are never used, and the mesh is only needed for its vectors,
+    # so skip the normals pass and normalize the loaded buffer in place
+    model_mesh = mesh.Mesh.from_file(model_path, calculate_normals=False)
+    vectors = model_mesh.vectors  # float32, kept that way through rendering
+
+    # Center the model and normalize scale. The largest absolute coordinate
+    # is unaffected by the axis swap below, so it can be taken here.
+    vectors -= vectors.mean(axis=(0, 1))
+    vectors /= max(vectors.max(), -vectors.min())
+
+    # Transform orientation: STL Z-up to display Y-up, i.e. (x, -z, y).
+    # Written straight into one contiguous array, with no zero-fill or
+    # temporary for the negated axis.
+    transformed = np.empty(vectors.shape, dtype=vectors.dtype)
     transformed[:, :, 0] = vectors[:, :, 0]
-    transformed[:, :, 1] = -vectors[:, :, 2]
+    np.negative(vectors[:, :, 2], out=transformed[:, :, 1])
     transformed[:, :, 2] = vectors[:, :, 1]
 
-    # Normalize scale
-    all_points = transformed.reshape(-1, 3)
-    scale = np.max(np.abs(all_points))
-    transformed = transformed / scale
-
     print(f"Loaded {len(transformed)} faces")
     return transformed
 
-def render_frame(faces, angle, output_path):
-    """Render a single frame at the given rotation angle"""
-    # Create rotation matrix for Z-axis rotation
-    rad = math.radians(angle)
-    cos_a, sin_a = math.cos(rad), math.sin(rad)
-    rotation_matrix = np.array([
-        [cos_a, -sin_a, 0],
-        [sin_a, cos_a, 0],
-        [0, 0, 1]
-    ])
-
-    # Apply rotation
-    rotated_faces = np.einsum('ij,...j->...i', rotation_matrix, faces)
-
-    # Create figure
-    fig = Figure(figsize=(4.5, 4.5), dpi=100, facecolor=BG_COLOR)
+def create_camera():
+    """Capture matplotlib's 3D view as plain matrices, computed once for all frames"""
+    # Deferred: matplotlib is the slowest import here and workers never need it
+    from matplotlib.figure import Figure
+
+    width, height = FRAME_SIZE
+    fig = Figure(figsize=(width / 100, height / 100), dpi=100)
     ax = fig.add_subplot(111, projection='3d')
-    ax.set_facecolor(BG_COLOR)
-    ax.set_axis_off()
     fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
 
-    # Add mesh
-    mesh_collection = Poly3DCollection(
-        rotated_faces,
-        facecolors=FACE_COLOR,
-        edgecolors=EDGE_COLOR,
-        linewidths=0.3,
-        alpha=0.9
-    )
-    ax.add_collection3d(mesh_collection)
-
     # Set view - with margin so model doesn't get cropped
     ax.set_xlim3d(-0.65, 0.65)
     ax.set_ylim3d(-0.65, 0.65)
@@ -89,31 +74,127 @@ def render_frame(faces, angle, output_path):
     ax.set_box_aspect([1, 1, 1])
     ax.view_init(elev=10, azim=-90)
 
-    # Save frame
-    fig.savefig(output_path, facecolor=BG_COLOR, edgecolor='none',
-                bbox_inches='tight', pad_inches=0)
-    fig.clear()
-    import matplotlib.pyplot as plt
-    plt.close(fig)
+    # 3D data -> projected coords, then projected coords -> figure pixels
+    return ax.get_proj(), ax.transData.get_affine().get_matrix().astype(np.float32)
+
+def rotation_matrices(count):
+    """Build the Z-axis rotations for all frames in one batch, shape (count, 2, 2)"""
+    angles = np.radians(np.arange(count) * 360 / count)
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    return np.stack([
+        np.stack([cos_a, -sin_a], axis=-1),
+        np.stack([sin_a, cos_a], axis=-1),
+    ], axis=1)
+
+def homogeneous_vertices(faces):
+    """Flatten faces to an (N*3, 4) array of homogeneous vertex coordinates"""
+    points = faces.reshape(-1, 3)
+    return np.hstack([points, np.ones((len(points), 1), dtype=points.dtype)])
+
+def homogeneous_centroids(faces):
+    """Face centroids as an (N, 4) homogeneous array, used for depth sorting"""
+    centroids = faces.mean(axis=1)
+    return np.hstack([centroids, np.ones((len(centroids), 1), dtype=centroids.dtype)])
+
+def create_canvas():
+    """Create the supersampled image a worker draws every frame into"""
+    size = (FRAME_SIZE[0] * SUPERSAMPLE, FRAME_SIZE[1] * SUPERSAMPLE)
+    return Image.new('RGB', size, BG_COLOR)
+
+def render_frame(vertices, centroids, rotation, output_path, projection, screen, canvas):
+    """Render a single frame with the given 2x2 Z-axis rotation into `canvas`"""
+    # Fold the rotation into the projection so each frame is one BLAS matmul
+    transform = np.eye(4)
+    transform[:2, :2] = rotation
+    # Match the float32 vertices so the matmul doesn't upcast to float64
+    transform = (projection @ transform).astype(np.float32)
+
+    # Project to pixels the same way matplotlib's 3D axes would; the
+    # projected z is not needed since depth comes from the centroids below
+    projected = vertices @ transform[[0, 1, 3]].T
+    projected = projected[:, :2] / projected[:, 2:]
+    pixels = projected @ screen[:2, :2].T + screen[:2, 2]
+    pixels[:, 1] = FRAME_SIZE[1] - pixels[:, 1]  # Image rows grow downwards
+    pixels *= SUPERSAMPLE
+
+    # Back-face culling: with the mesh's consistent winding, front faces
+    # come out clockwise in image space (negative signed area)
+    triangles = pixels.reshape(-1, 3, 2)
+    edge_a = triangles[:, 1] - triangles[:, 0]
+    edge_b = triangles[:, 2] - triangles[:, 0]
+    visible = np.flatnonzero(edge_a[:, 0] * edge_b[:, 1] < edge_a[:, 1] * edge_b[:, 0])
+
+    # Painter's algorithm: draw the farthest faces first. The projected
+    # depth grows with w, so sorting face centroids by w is enough.
+    depths = centroids[visible] @ transform[3]
+    polygons = triangles[visible[np.argsort(-depths)]].reshape(-1, 6)
+
+    # Rasterize at a higher resolution, then downsample for smooth edges.
+    # The canvas is reused across frames, so clear it instead of reallocating.
+    canvas.paste(BG_COLOR, (0, 0, *canvas.size))
+    draw = ImageDraw.Draw(canvas, 'RGBA')
+    for polygon in polygons.tolist():
+        draw.polygon(polygon, fill=FACE_RGBA, outline=EDGE_RGBA)
+
+    # Save frame - via a temp file so an interrupted run never leaves a
+    # truncated frame behind that would later be mistaken for a finished one
+    image = canvas.resize(FRAME_SIZE, Image.Resampling.LANCZOS)
+    temp_path = output_path + '.tmp'
+    image.save(temp_path, format='JPEG', quality=JPEG_QUALITY, subsampling=1)
+    os.replace(temp_path, output_path)
+
+def _init_worker(faces, rotations, projection, screen):
+    """Process pool initializer: keep the shared render inputs per worker"""
+    global _worker_scene
+    _worker_scene = (homogeneous_vertices(faces), homogeneous_centroids(faces),
+                     rotations, projection, screen, create_canvas())
+
+def frame_path(index):
+    """Path of the cached frame file for frame number `index`"""
+    return os.path.join(CACHE_DIR, f'frame_{index:03d}.jpg')
+
+def _render_task(index):
+    """Render frame number `index` using this worker's scene"""
+    vertices, centroids, rotations, projection, screen, canvas = _worker_scene
+    output_path = frame_path(index)
+    render_frame(vertices, centroids, rotations[index], output_path,
+                 projection, screen, canvas)
+    return index
 
 def main():
     """Pre-render all rotation frames"""
     os.makedirs(CACHE_DIR, exist_ok=True)
 
+    # Only render frames that are missing, so an interrupted run can resume
+    pending = [i for i in range(FRAME_COUNT)
+               if not os.path.exists(frame_path(i)) or os.path.getsize(frame_path(i)) == 0]
+    if not pending:
+        print(f"All {FRAME_COUNT} frames already rendered in {CACHE_DIR}")
+        return
+
     faces = load_and_prepare_model()
     if faces is None:
         return
 
-    print(f"Rendering {FRAME_COUNT} frames...")
-
-    for i in range(FRAME_COUNT):
-        angle = (i * 360) / FRAME_COUNT
-        output_path = os.path.join(CACHE_DIR, f'frame_{i:03d}.png')
-        render_frame(faces, angle, output_path)
-
-        # Progress indicator
-        progress = (i + 1) / FRAME_COUNT * 100
-        print(f"\rProgress: {progress:.1f}% ({i+1}/{FRAME_COUNT})", end='', flush=True)
+    rotations = rotation_matrices(FRAME_COUNT)
+    projection, screen = create_camera()
+
+    # No more workers than frames left; Windows rejects max_workers above 61
+    workers = min(len(pending), os.cpu_count() or 1)
+    if sys.platform == 'win32':
+        workers = min(workers, 61)
+    print(f"Rendering {len(pending)} of {FRAME_COUNT} frames on {workers} processes...")
+
+    # Frames are independent; faces are sent once per worker, not per frame
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(faces, rotations, projection, screen)) as executor:
+        futures = [executor.submit(_render_task, i) for i in pending]
+        for done, future in enumerate(as_completed(futures), 1):
+            future.result()
+
+            # Progress indicator
+            progress = done / len(pending) * 100
+            print(f"\rProgress: {progress:.1f}% ({done}/{len(pending)})", end='', flush=True)
 
     print(f"\nDone! Frames saved to {CACHE_DIR}")
 
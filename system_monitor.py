@@ -7,16 +7,37 @@ Iron Man inspired HUD interface with pre-rendered 3D model animation
 import tkinter as tk
 from tkinter import font as tkfont
 from PIL import Image, ImageTk
+import numpy as np
 import psutil
 import platform
 import os
 import math
 import random
 from datetime import datetime
-from collections import deque
 import glob
 import threading
 import time
+import functools
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# (upper bound, multiplier, format) per network speed unit
+_SPEED_UNITS = (
+    (1024, 1.0, "%.0f B/s"),
+    (1024 * 1024, 1 / 1024, "%.1f KB/s"),
+    (float('inf'), 1 / (1024 * 1024), "%.1f MB/s"),
+)
+
+# Zero-padded seconds for the footer clock (tm_sec goes up to 61 for leap seconds)
+_SECONDS = tuple(f"{sec:02d}" for sec in range(62))
+
+# Directory names (or project-relative paths) never scanned for code lines
+_IGNORE_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules', '.venv', 'venv', 'build', 'dist',
+    os.path.join('ironman', 'cache'),
+})
 
 class JarvisMonitor:
     def __init__(self, root):
@@ -52,16 +73,23 @@ class JarvisMonitor:
             'battery_percent': None,
             'battery_plugged': False,
             'top_process': '...',
-            'gpu_status': 'ACTIVE',
-            'gpu_info': self._get_gpu_info(),
             'self_mem': 0,
         }
 
         # Flag to stop background thread
         self._running = True
 
+        # GPU status never changes at runtime, so it is resolved once and shown as-is
+        self._gpu_status = 'ACTIVE'
+        self._gpu_info = self._get_gpu_info()
+
         # Initialize data
         self.process = psutil.Process(os.getpid())
+        # Prime the non-blocking CPU sampler so the first reading covers startup
+        psutil.cpu_percent(interval=None)
+        # Probe optional stats once so the stats loop doesn't raise and catch them every pass
+        self._has_swap = self._probe_stat(getattr(psutil, 'swap_memory', None))
+        self._has_battery = self._probe_stat(getattr(psutil, 'sensors_battery', None))
 
         # Pre-create fonts
         self.small_font = tkfont.Font(family='Helvetica', size=8)
@@ -71,12 +99,39 @@ class JarvisMonitor:
         self.hud_font = tkfont.Font(family='Courier', size=9)
         self.loading_font = tkfont.Font(family='Helvetica', size=16)
 
-        # Historical data
+        # Arc gauge geometry is fixed, so tick segments and needle tips are
+        # computed once (needle tips indexed by integer percent)
+        self._gauge_center = (105, 115)
+        self._gauge_radius = 85
+        cx, cy = self._gauge_center
+        radius = self._gauge_radius
+        self._gauge_ticks = tuple(
+            (cx + (radius - 10) * math.cos(a), cy - (radius - 10) * math.sin(a),
+             cx + (radius - 5) * math.cos(a), cy - (radius - 5) * math.sin(a))
+            for a in (math.radians(180 - i * 18) for i in range(11))
+        )
+        self._needle_lut = tuple(
+            (cx + (radius - 20) * math.cos(math.radians(180 - p * 1.8)),
+             cy - (radius - 20) * math.sin(math.radians(180 - p * 1.8)))
+            for p in range(101)
+        )
+
+        # Historical data (ring buffers sharing one write cursor; oldest sample at _hist_idx).
+        # Percentages are whole numbers and speeds whole bytes/sec (uint32 covers 4 GB/s)
         self.max_data_points = 60
-        self.cpu_history = deque([0] * self.max_data_points, maxlen=self.max_data_points)
-        self.mem_history = deque([0] * self.max_data_points, maxlen=self.max_data_points)
-        self.net_up_history = deque([0] * self.max_data_points, maxlen=self.max_data_points)
-        self.net_down_history = deque([0] * self.max_data_points, maxlen=self.max_data_points)
+        self.cpu_history = np.zeros(self.max_data_points, dtype=np.uint8)
+        self.mem_history = np.zeros(self.max_data_points, dtype=np.uint8)
+        self.net_up_history = np.zeros(self.max_data_points, dtype=np.uint32)
+        self.net_down_history = np.zeros(self.max_data_points, dtype=np.uint32)
+        self._hist_idx = 0
+        self._net_graph_drawn = None
+
+        # Last text set on each stats label (see _set_text)
+        self._label_text = {}
+        self._cpu_detail_key = None
+        self._cpu_detail = ''
+        self._time_prefix_key = None
+        self._time_prefix = ''
 
         # Pre-rendered frames
         self.frames = []
@@ -109,6 +164,16 @@ class JarvisMonitor:
             return "Linux GPU"
         return "GPU"
 
+    @staticmethod
+    def _probe_stat(func):
+        """Return True if an optional psutil call exists, succeeds and returns data"""
+        if func is None:
+            return False
+        try:
+            return func() is not None
+        except Exception:
+            return False
+
     def _on_close(self):
         """Handle window close - stop background thread"""
         self._running = False
@@ -163,6 +228,8 @@ class JarvisMonitor:
 
         self.update_loading_progress(0.6, "Scanning code files...")
         self.load_code_lines()
+        # Labels only show 25 columns, so truncate once instead of every scroll tick
+        self.code_lines = tuple(line[:25] for line in self.code_lines)
 
         self.update_loading_progress(0.8, "Setting up interface...")
         self.root.update()
@@ -178,60 +245,78 @@ class JarvisMonitor:
         self._stats_thread.start()
 
         # Start unified animation loop (single timer for all animations)
-        self._tick_counter = 0
+        now = time.monotonic()
+        self._next_frame_time = now
+        self._next_scroll_time = now
+        self._next_stats_time = now
         self.unified_update()
 
     def _collect_stats_background(self):
         """Background thread: Collect all system stats without blocking UI"""
-        last_net_io = psutil.net_io_counters()
-        last_time = time.time()
+        last_tx, last_rx = psutil.net_io_counters()[:2]  # bytes_sent, bytes_recv
+        last_time_ns = time.monotonic_ns()
         proc_update_counter = 0
+        # Slow-changing stats (CPU frequency, swap, process count, battery) refresh every 5 iterations
+        slow_update_counter = 0
+        cpu_freq = None
+        swap_percent = 0
+        proc_count = 0
+        battery_percent = None
+        battery_plugged = False
+        # pid -> psutil.Process, primed here so the first scan reads a full sampling window;
+        # membership is refreshed after every other top-process scan
+        proc_cache = {}
+        proc_cache_counter = 0
+        try:
+            self._refresh_proc_cache(proc_cache)
+        except psutil.Error:
+            pass
 
         while self._running:
             try:
                 # Collect all stats (this can be slow - doesn't matter, we're in background)
-                cpu_percent = psutil.cpu_percent(interval=0.5)  # Blocking is fine here
-                cpu_freq = psutil.cpu_freq()
+                cpu_percent = psutil.cpu_percent(interval=None)  # Usage since the previous call
+
+                slow_update = slow_update_counter == 0
+                slow_update_counter = (slow_update_counter + 1) % 5
+
+                if slow_update:
+                    cpu_freq = psutil.cpu_freq()  # Reads a sysfs file per core
+
                 mem = psutil.virtual_memory()
 
-                # Network
-                current_time = time.time()
-                current_net_io = psutil.net_io_counters()
-                time_delta = current_time - last_time
+                # Network (monotonic clock, so wall-clock steps can't skew the speed)
+                current_time_ns = time.monotonic_ns()
+                tx, rx = psutil.net_io_counters()[:2]
 
-                if time_delta > 0:
-                    up_speed = (current_net_io.bytes_sent - last_net_io.bytes_sent) / time_delta
-                    down_speed = (current_net_io.bytes_recv - last_net_io.bytes_recv) / time_delta
+                if current_time_ns > last_time_ns:
+                    inv_dt = 1e9 / (current_time_ns - last_time_ns)
+                    up_speed = (tx - last_tx) * inv_dt
+                    down_speed = (rx - last_rx) * inv_dt
                 else:
                     up_speed = 0
                     down_speed = 0
 
-                last_net_io = current_net_io
-                last_time = current_time
+                last_tx, last_rx = tx, rx
+                last_time_ns = current_time_ns
 
-                # Swap
-                try:
-                    swap = psutil.swap_memory()
-                    swap_percent = swap.percent
-                except:
-                    swap_percent = 0
+                if slow_update:
+                    # Swap
+                    if self._has_swap:
+                        swap_percent = psutil.swap_memory().percent
 
-                # Process count
-                try:
+                    # Process count
                     proc_count = len(psutil.pids())
-                except:
-                    proc_count = 0
 
-                # Battery
-                battery_percent = None
-                battery_plugged = False
-                try:
-                    battery = psutil.sensors_battery()
-                    if battery:
-                        battery_percent = battery.percent
-                        battery_plugged = battery.power_plugged
-                except:
-                    pass
+                    # Battery (can still disappear at runtime, e.g. when removed)
+                    if self._has_battery:
+                        battery = psutil.sensors_battery()
+                        if battery:
+                            battery_percent = battery.percent
+                            battery_plugged = battery.power_plugged
+                        else:
+                            battery_percent = None
+                            battery_plugged = False
 
                 # Top process (only every few iterations - very expensive)
                 proc_update_counter += 1
@@ -239,12 +324,25 @@ class JarvisMonitor:
                 if proc_update_counter >= 5:
                     proc_update_counter = 0
                     try:
-                        top_proc = max(
-                            psutil.process_iter(['name', 'cpu_percent']),
-                            key=lambda p: p.info['cpu_percent'] or 0
-                        )
-                        if top_proc.info['cpu_percent'] and top_proc.info['cpu_percent'] > 0:
-                            top_process = top_proc.info['name'][:10]
+                        # Single pass over cached handles; only the winner's name is looked up
+                        top_cpu = 0
+                        top_proc = None
+                        for pid, proc in list(proc_cache.items()):
+                            try:
+                                cpu = proc.cpu_percent(interval=None)
+                            except psutil.Error:
+                                del proc_cache[pid]
+                                continue
+                            if cpu > top_cpu:
+                                top_cpu, top_proc = cpu, proc
+                        if top_proc is not None:
+                            top_process = f"{top_proc.name():.10}"
+
+                        # Refresh membership after reading, so new handles are
+                        # first read a whole scan interval later
+                        proc_cache_counter = (proc_cache_counter + 1) % 2
+                        if proc_cache_counter == 0:
+                            self._refresh_proc_cache(proc_cache)
                     except:
                         pass
 
@@ -263,8 +361,8 @@ class JarvisMonitor:
                     self._stats['mem_total'] = mem.total
                     self._stats['net_up_speed'] = up_speed
                     self._stats['net_down_speed'] = down_speed
-                    self._stats['net_total_sent'] = current_net_io.bytes_sent
-                    self._stats['net_total_recv'] = current_net_io.bytes_recv
+                    self._stats['net_total_sent'] = tx
+                    self._stats['net_total_recv'] = rx
                     self._stats['swap_percent'] = swap_percent
                     self._stats['proc_count'] = proc_count
                     self._stats['battery_percent'] = battery_percent
@@ -273,17 +371,33 @@ class JarvisMonitor:
                         self._stats['top_process'] = top_process
                     self._stats['self_mem'] = self_mem
 
-                # Sleep a bit before next collection
-                time.sleep(0.5)
+                # Sleep until next collection (also the CPU sampling window)
+                time.sleep(1.0)
 
             except Exception as e:
                 print(f"Background stats error: {e}")
                 time.sleep(1)
 
+    @staticmethod
+    def _refresh_proc_cache(proc_cache):
+        """Sync the pid -> Process cache with the current pid list (call after a scan, never right before one)"""
+        pids = set(psutil.pids())
+        for pid in proc_cache.keys() - pids:
+            del proc_cache[pid]
+        for pid in pids - proc_cache.keys():
+            try:
+                proc = psutil.Process(pid)
+                # Prime the non-blocking sampler now; the next scan, a full interval
+                # later, reads real usage instead of the meaningless first value
+                proc.cpu_percent(interval=None)
+                proc_cache[pid] = proc
+            except psutil.Error:
+                pass
+
     def load_frames(self):
         """Load pre-rendered animation frames"""
         cache_dir = os.path.join(os.path.dirname(__file__), 'ironman', 'cache')
-        frame_files = sorted(glob.glob(os.path.join(cache_dir, 'frame_*.png')))
+        frame_files = sorted(glob.glob(os.path.join(cache_dir, 'frame_*.jpg')))
 
         if not frame_files:
             print(f"No pre-rendered frames found in {cache_dir}")
@@ -292,20 +406,112 @@ class JarvisMonitor:
 
         # Target size - keep original square ratio
         target_size = (300, 300)
+        # The install dir may be read-only, so the resized cache lives per user;
+        # the path hash keeps separate checkouts from clobbering each other
+        resized_cache = os.path.join(
+            self._user_cache_dir(),
+            f'frames_{target_size[0]}x{target_size[1]}_{zlib.crc32(cache_dir.encode()):08x}.npz')
+
+        # Reuse the resized frames from the last run if they are still fresh
+        images = self._load_resized_frames(resized_cache, frame_files, target_size)
+        if images is None:
+            # Decode and resize in worker threads (PIL releases the GIL)
+            images = [None] * len(frame_files)
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {executor.submit(self._resize_frame, frame_path, target_size): i
+                           for i, frame_path in enumerate(frame_files)}
+                for done, future in enumerate(as_completed(futures), 1):
+                    images[futures[future]] = future.result()
+
+                    # Update progress
+                    if done % 25 == 0:
+                        progress = 0.1 + (done / len(frame_files)) * 0.5
+                        self.update_loading_progress(progress, f"Loading frames... {done}/{len(frame_files)}")
+            images = self._quantize_frames(images)
+            self._save_resized_frames(resized_cache, images)
+
+        # Keep plain PIL images; they are pasted into two PhotoImage buffers for display
+        self.frames = images
 
-        for i, frame_path in enumerate(frame_files):
-            img = Image.open(frame_path)
-            # Resize to fit the model container
-            img = img.resize(target_size, Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
-            self.frames.append(photo)
+        print(f"Loaded {len(self.frames)} animation frames")
 
-            # Update progress
-            if i % 10 == 0:
-                progress = 0.1 + (i / len(frame_files)) * 0.5
-                self.update_loading_progress(progress, f"Loading frames... {i+1}/{len(frame_files)}")
+    @staticmethod
+    def _resize_frame(frame_path, target_size):
+        """Decode one frame and resize it to fit the model container"""
+        with Image.open(frame_path) as img:
+            return img.resize(target_size, Image.Resampling.LANCZOS)
+
+    @staticmethod
+    def _quantize_frames(images):
+        """Convert frames to 8-bit palette images sharing one adaptive palette"""
+        # A palette built from a sample of the whole rotation keeps colors
+        # stable from frame to frame (no per-frame palette flicker)
+        sample = Image.fromarray(np.concatenate([np.asarray(img.convert('RGB')) for img in images[::8]]))
+        palette = sample.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+        return [img.convert('RGB').quantize(palette=palette, dither=Image.Dither.NONE) for img in images]
+
+    def _load_resized_frames(self, cache_file, frame_files, target_size):
+        """Load display-size frames cached by a previous run, or None if stale/missing"""
+        try:
+            if os.path.getmtime(cache_file) < max(os.path.getmtime(p) for p in frame_files):
+                return None
+            with np.load(cache_file) as data:
+                frames = data['frames']
+                palette = data['palette'].tolist()
+        except (OSError, ValueError, KeyError):
+            return None
+        if frames.shape != (len(frame_files), target_size[1], target_size[0]):
+            return None
+        images = []
+        for frame in frames:
+            img = Image.fromarray(frame)
+            img.putpalette(palette)
+            images.append(img)
+        return images
+
+    @staticmethod
+    def _user_cache_dir():
+        """Return the per-user cache directory for derived data"""
+        if platform.system() == 'Windows':
+            base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+        elif platform.system() == 'Darwin':
+            base = os.path.expanduser('~/Library/Caches')
+        else:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+        return os.path.join(base, 'jarvis-monitor')
 
-        print(f"Loaded {len(self.frames)} animation frames")
+    def _save_resized_frames(self, cache_file, images):
+        """Cache display-size palette frames so later startups can skip decode and resize"""
+        tmp_file = cache_file + '.tmp.npz'
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            np.savez(tmp_file,
+                     frames=np.stack([np.asarray(img) for img in images]),
+                     palette=np.array(images[0].getpalette(), dtype=np.uint8))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _scan_code_files(root_dir, extensions):
+        """Yield DirEntry objects for files under root_dir with an extension in extensions"""
+        pending = [(root_dir, '')]
+        while pending:
+            dir_path, rel_dir = pending.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            # Prune ignored trees instead of walking and filtering them
+                            rel_path = os.path.join(rel_dir, entry.name)
+                            if entry.name not in _IGNORE_DIRS and rel_path not in _IGNORE_DIRS:
+                                pending.append((entry.path, rel_path))
+                        elif os.path.splitext(entry.name)[1] in extensions and entry.is_file():
+                            yield entry
+            except OSError:
+                continue
 
     def load_code_lines(self):
         """Load code lines from cache file (fast) or generate if missing"""
@@ -315,7 +521,8 @@ class JarvisMonitor:
         if os.path.exists(cache_file):
             try:
                 with open(cache_file, 'r', encoding='utf-8') as f:
-                    self.code_lines = [line.rstrip() for line in f.readlines() if line.strip()]
+                    # Lines were rstripped when the cache was written, so one read + split is enough
+                    self.code_lines = [line for line in f.read().splitlines() if line.strip()]
                 print(f"Loaded {len(self.code_lines)} code lines from cache")
                 return
             except:
@@ -324,19 +531,23 @@ class JarvisMonitor:
         # Generate and cache - only scan current project directory (fast)
         print("Generating code lines cache...")
         project_dir = os.path.dirname(__file__)
-        code_extensions = ['*.py', '*.js', '*.ts', '*.json', '*.sh']
+        code_extensions = {'.py', '.js', '.ts', '.json', '.sh'}
 
         all_lines = []
-        for ext in code_extensions:
-            for file_path in glob.glob(os.path.join(project_dir, '**', ext), recursive=True):
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        for line in f.readlines()[:50]:
-                            line = line.rstrip()
-                            if 5 < len(line) < 60:
-                                all_lines.append(line)
-                except:
+        for entry in self._scan_code_files(project_dir, code_extensions):
+            try:
+                # Only the first 50 lines are used, so skip big files and stop reading early
+                if entry.stat().st_size > 256 * 1024:
                     continue
+                with open(entry.path, 'r', encoding='utf-8', errors='ignore') as f:
+                    for i, line in enumerate(f):
+                        if i >= 50:
+                            break
+                        line = line.rstrip()
+                        if 5 < len(line) < 60:
+                            all_lines.append(line)
+            except:
+                continue
 
         # Add some cool Iron Man themed lines
         jarvis_lines = [
@@ -453,6 +664,7 @@ class JarvisMonitor:
 
         self.cpu_canvas = tk.Canvas(parent, width=210, height=130, bg=self.bg_color, highlightthickness=0)
         self.cpu_canvas.pack()
+        self.cpu_gauge_ids = self.init_arc_gauge(self.cpu_canvas, color=self.primary)
 
         self.cpu_value_label = tk.Label(parent, text="0%", font=self.value_font, bg=self.bg_color, fg=self.primary)
         self.cpu_value_label.pack()
@@ -466,6 +678,7 @@ class JarvisMonitor:
 
         self.mem_canvas = tk.Canvas(parent, width=210, height=130, bg=self.bg_color, highlightthickness=0)
         self.mem_canvas.pack()
+        self.mem_gauge_ids = self.init_arc_gauge(self.mem_canvas, color=self.accent)
 
         self.mem_value_label = tk.Label(parent, text="0%", font=self.value_font, bg=self.bg_color, fg=self.accent)
         self.mem_value_label.pack()
@@ -477,10 +690,10 @@ class JarvisMonitor:
         gpu_label = tk.Label(parent, text="GPU STATUS", font=self.label_font, bg=self.bg_color, fg=self.warning)
         gpu_label.pack(pady=(10, 5))
 
-        self.gpu_value_label = tk.Label(parent, text="ACTIVE", font=self.value_font, bg=self.bg_color, fg=self.warning)
+        self.gpu_value_label = tk.Label(parent, text=self._gpu_status, font=self.value_font, bg=self.bg_color, fg=self.warning)
         self.gpu_value_label.pack()
 
-        self.gpu_detail_label = tk.Label(parent, text="", font=self.hud_font, bg=self.bg_color, fg=self.text_dim)
+        self.gpu_detail_label = tk.Label(parent, text=self._gpu_info, font=self.hud_font, bg=self.bg_color, fg=self.text_dim)
         self.gpu_detail_label.pack()
 
     def create_3d_panel(self, parent):
@@ -504,9 +717,15 @@ class JarvisMonitor:
         self.model_label = tk.Label(model_container, bg='#050810')
         self.model_label.place(relx=0.5, rely=0.5, anchor='center')
 
-        # Show first frame if available
+        # Show first frame if available. Two PhotoImages are used as front and
+        # back buffers: the next frame is pasted into the hidden one ahead of time
         if self.frames:
-            self.model_label.config(image=self.frames[0])
+            # current_frame tracks the frame held by the back buffer
+            self.current_frame = 1 % len(self.frames)
+            self.model_photos = [ImageTk.PhotoImage(self.frames[0]),
+                                 ImageTk.PhotoImage(self.frames[self.current_frame])]
+            self.model_back = 1
+            self.model_label.config(image=self.model_photos[0])
 
         # Code panels container - expand to fill
         code_outer = tk.Frame(main_container, bg=self.bg_color)
@@ -516,6 +735,12 @@ class JarvisMonitor:
         code_frame = tk.Frame(code_outer, bg=self.bg_color)
         code_frame.place(relx=0.5, rely=0, anchor='n', relheight=1.0)
 
+        # Code lines fade out at the top and bottom edges; the fade is fixed
+        # per row, so colors are set once here and scrolling only swaps text
+        code_line_count = 15
+        code_line_colors = ['#1a3a4a' if (i < 2 or i > code_line_count - 3) else '#00a0c0'
+                            for i in range(code_line_count)]
+
         # Left code scroll panel - SYS (using Labels for Windows performance)
         left_code_frame = tk.Frame(code_frame, bg='#0a0f14', width=155,
                                    highlightbackground=self.secondary, highlightthickness=1)
@@ -528,9 +753,9 @@ class JarvisMonitor:
 
         # Use Labels instead of Canvas for better Windows performance
         self.left_code_labels = []
-        for i in range(15):  # Fixed number of visible lines
+        for i in range(code_line_count):  # Fixed number of visible lines
             lbl = tk.Label(left_code_frame, text="", font=('Courier', 6),
-                          bg='#0a0f14', fg='#00a0c0', anchor='w', width=25)
+                          bg='#0a0f14', fg=code_line_colors[i], anchor='w', width=25)
             lbl.pack(anchor='w', padx=2)
             self.left_code_labels.append(lbl)
 
@@ -546,9 +771,9 @@ class JarvisMonitor:
 
         # Use Labels instead of Canvas for better Windows performance
         self.right_code_labels = []
-        for i in range(15):  # Fixed number of visible lines
+        for i in range(code_line_count):  # Fixed number of visible lines
             lbl = tk.Label(right_code_frame, text="", font=('Courier', 6),
-                          bg='#0a0f14', fg='#00a0c0', anchor='w', width=25)
+                          bg='#0a0f14', fg=code_line_colors[i], anchor='w', width=25)
             lbl.pack(anchor='w', padx=2)
             self.right_code_labels.append(lbl)
 
@@ -575,6 +800,7 @@ class JarvisMonitor:
         self.net_canvas = tk.Canvas(parent, width=210, height=80, bg=self.bg_color, highlightthickness=1,
                                      highlightbackground=self.secondary)
         self.net_canvas.pack()
+        self.init_network_graph()
 
         # Upload stats
         up_frame = tk.Frame(parent, bg=self.bg_color)
@@ -610,9 +836,6 @@ class JarvisMonitor:
         sys_label = tk.Label(parent, text="SYSTEM INFO", font=self.label_font, bg=self.bg_color, fg=self.primary)
         sys_label.pack(pady=(0, 5))
 
-        # System details
-        self.sys_info_frame = tk.Frame(parent, bg=self.bg_color)
-        self.sys_info_frame.pack(fill=tk.X)
 
         # Get more detailed info
         try:
@@ -639,11 +862,20 @@ class JarvisMonitor:
             ("HOST:", platform.node()[:12]),
         ]
 
-        for label, value in info_items:
-            row = tk.Frame(self.sys_info_frame, bg=self.bg_color)
-            row.pack(fill=tk.X, pady=1)
-            tk.Label(row, text=label, font=self.small_font, bg=self.bg_color, fg=self.text_dim).pack(side=tk.LEFT)
-            tk.Label(row, text=value, font=self.hud_font, bg=self.bg_color, fg=self.primary).pack(side=tk.RIGHT)
+        # System details - one canvas with a text item per key/value instead of 12 labels
+        width = 280
+        row_height = 17
+        self.sys_info_canvas = tk.Canvas(parent, width=width, height=row_height * len(info_items),
+                                         bg=self.bg_color, highlightthickness=0)
+        self.sys_info_canvas.pack(fill=tk.X)
+
+        self._sys_value_ids = {}
+        for i, (label, value) in enumerate(info_items):
+            y = row_height * i + row_height // 2
+            self.sys_info_canvas.create_text(0, y, anchor='w', text=label,
+                                             font=self.small_font, fill=self.text_dim)
+            self._sys_value_ids[label.rstrip(':')] = self.sys_info_canvas.create_text(
+                width, y, anchor='e', text=value, font=self.hud_font, fill=self.primary)
 
         # Divider
         tk.Frame(parent, height=1, bg=self.secondary).pack(fill=tk.X, pady=10)
@@ -715,16 +947,13 @@ class JarvisMonitor:
         )
         self.footer_status_label.pack()
 
-    def draw_arc_gauge(self, canvas, value, max_value=100, color=None):
-        """Draw a JARVIS-style arc gauge"""
+    def init_arc_gauge(self, canvas, color=None):
+        """Draw the static parts of a JARVIS-style arc gauge and return the dynamic item ids"""
         if color is None:
             color = self.primary
 
-        canvas.delete("all")
-        width = 210
-        height = 130
-        cx, cy = width // 2, height - 15
-        radius = 85
+        cx, cy = self._gauge_center
+        radius = self._gauge_radius
 
         # Draw background arc
         start_angle = 180
@@ -736,149 +965,227 @@ class JarvisMonitor:
         )
 
         # Draw tick marks
-        for i in range(11):
-            angle = math.radians(180 - i * 18)
-            x1 = cx + (radius - 10) * math.cos(angle)
-            y1 = cy - (radius - 10) * math.sin(angle)
-            x2 = cx + (radius - 5) * math.cos(angle)
-            y2 = cy - (radius - 5) * math.sin(angle)
+        for x1, y1, x2, y2 in self._gauge_ticks:
             canvas.create_line(x1, y1, x2, y2, fill=self.text_dim, width=1)
 
-        # Draw value arc
-        value_extent = (value / max_value) * 180
-        canvas.create_arc(
+        # Value arc, glow, needle and hub are updated in place by update_arc_gauge
+        ids = {'drawn': None}
+        ids['value_arc'] = canvas.create_arc(
             cx - radius, cy - radius, cx + radius, cy + radius,
-            start=start_angle, extent=value_extent,
+            start=start_angle, extent=0,
             outline=color, width=4, style='arc'
         )
+        ids['glow_arc'] = canvas.create_arc(
+            cx - radius + 5, cy - radius + 5, cx + radius - 5, cy + radius - 5,
+            start=start_angle, extent=0,
+            outline=color, width=2, style='arc', state='hidden'
+        )
+        ids['needle_line'] = canvas.create_line(cx, cy, cx - (radius - 20), cy, fill=color, width=2)
+        ids['needle_dot'] = canvas.create_oval(cx - 4, cy - 4, cx + 4, cy + 4, fill=color, outline=color)
+        return ids
+
+    def update_arc_gauge(self, canvas, ids, value, max_value=100, color=None):
+        """Move the value arc and needle of a gauge created by init_arc_gauge"""
+        if color is None:
+            color = self.primary
+
+        # Skip the canvas calls if the gauge would look the same as last time
+        percent = min(max(round(value * 100 / max_value), 0), 100)
+        drawn = (percent, value > 70, value > 90, color)
+        if drawn == ids['drawn']:
+            return
+        ids['drawn'] = drawn
+
+        # Value arc
+        value_extent = (value / max_value) * 180
+        canvas.itemconfigure(ids['value_arc'], extent=value_extent, outline=color)
 
-        # Draw glow effect for high values
+        # Glow effect for high values
         if value > 70:
             glow_color = self.warning if value > 90 else color
-            canvas.create_arc(
-                cx - radius + 5, cy - radius + 5, cx + radius - 5, cy + radius - 5,
-                start=start_angle, extent=value_extent,
-                outline=glow_color, width=2, style='arc'
-            )
-
-        # Draw needle
-        needle_angle = math.radians(180 - (value / max_value) * 180)
-        needle_x = cx + (radius - 20) * math.cos(needle_angle)
-        needle_y = cy - (radius - 20) * math.sin(needle_angle)
-        canvas.create_line(cx, cy, needle_x, needle_y, fill=color, width=2)
-        canvas.create_oval(cx - 4, cy - 4, cx + 4, cy + 4, fill=color, outline=color)
+            canvas.itemconfigure(ids['glow_arc'], extent=value_extent, outline=glow_color, state='normal')
+        else:
+            canvas.itemconfigure(ids['glow_arc'], state='hidden')
 
-    def draw_network_graph(self):
-        """Draw network activity graph with real data"""
-        canvas = self.net_canvas
-        canvas.delete("all")
+        # Needle
+        cx, cy = self._gauge_center
+        needle_x, needle_y = self._needle_lut[percent]
+        canvas.coords(ids['needle_line'], cx, cy, needle_x, needle_y)
 
+    def init_network_graph(self):
+        """Draw the static grid and create the polylines moved by draw_network_graph"""
+        canvas = self.net_canvas
         width = 210
         height = 80
         padding = 5
-        graph_width = width - 2 * padding
         graph_height = height - 2 * padding
 
         # Draw grid
+        self._net_grid_ids = []
         for i in range(4):
             y = padding + graph_height * i / 3
-            canvas.create_line(padding, y, width - padding, y, fill=self.text_dim, dash=(1, 3))
+            self._net_grid_ids.append(
+                canvas.create_line(padding, y, width - padding, y, fill=self.text_dim, dash=(1, 3)))
+
+        # Download line (cyan) and upload line (orange), flat until the first update
+        baseline = (padding, height - padding, width - padding, height - padding)
+        self._net_down_line = canvas.create_line(baseline, fill=self.primary, width=1)
+        self._net_up_line = canvas.create_line(baseline, fill=self.accent, width=1)
+
+        # Interleaved (x, y) point buffer reused by every update; x never changes
+        graph_width = width - 2 * padding
+        self._net_points = np.empty((self.max_data_points, 2))
+        self._net_points[:, 0] = padding + np.arange(self.max_data_points) * (graph_width / self.max_data_points)
+        self._net_base_y = height - padding
+        self._net_graph_height = graph_height
+
+    def draw_network_graph(self):
+        """Update the network graph polylines with real data"""
+        canvas = self.net_canvas
+
+        # Unroll the ring buffers into chronological order
+        up = np.roll(self.net_up_history, -self._hist_idx)
+        down = np.roll(self.net_down_history, -self._hist_idx)
+
+        # Nothing to redraw if the visible history hasn't changed (e.g. idle network)
+        drawn = (up.tobytes(), down.tobytes())
+        if drawn == self._net_graph_drawn:
+            return
+        self._net_graph_drawn = drawn
 
         # Get max value for scaling
-        max_up = max(self.net_up_history) if max(self.net_up_history) > 0 else 1
-        max_down = max(self.net_down_history) if max(self.net_down_history) > 0 else 1
-        max_val = max(max_up, max_down)
-
-        # Draw download line (cyan)
-        points_down = []
-        for i, val in enumerate(self.net_down_history):
-            x = padding + (i / len(self.net_down_history)) * graph_width
-            y = height - padding - (val / max_val) * graph_height
-            points_down.append((x, y))
-
-        if len(points_down) > 1:
-            for i in range(len(points_down) - 1):
-                canvas.create_line(points_down[i][0], points_down[i][1],
-                                  points_down[i+1][0], points_down[i+1][1],
-                                  fill=self.primary, width=1)
-
-        # Draw upload line (orange)
-        points_up = []
-        for i, val in enumerate(self.net_up_history):
-            x = padding + (i / len(self.net_up_history)) * graph_width
-            y = height - padding - (val / max_val) * graph_height
-            points_up.append((x, y))
-
-        if len(points_up) > 1:
-            for i in range(len(points_up) - 1):
-                canvas.create_line(points_up[i][0], points_up[i][1],
-                                  points_up[i+1][0], points_up[i+1][1],
-                                  fill=self.accent, width=1)
-
-    def format_bytes(self, bytes_val):
+        max_val = max(float(up.max()), float(down.max()), 1.0)
+        scale = -self._net_graph_height / max_val
+
+        # Move the download and upload polylines in place, filling only the y column
+        points = self._net_points
+        ys = points[:, 1]
+        for values, line in ((down, self._net_down_line), (up, self._net_up_line)):
+            np.multiply(values, scale, out=ys)
+            ys += self._net_base_y
+            canvas.coords(line, points.ravel().tolist())
+
+    # Byte counts from psutil are ints and the totals (memory, network) repeat across
+    # ticks; a small LRU keeps those hot while churning values like mem_used age out
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def format_bytes(bytes_val):
         """Format bytes to human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_val < 1024.0:
-                return f"{bytes_val:.1f} {unit}"
-            bytes_val /= 1024.0
-        return f"{bytes_val:.1f} PB"
+        # Each unit spans 10 bits, so the unit index falls out of the bit length
+        unit = min((int(bytes_val).bit_length() - 1) // 10, 5) if bytes_val >= 1 else 0
+        return f"{bytes_val / (1 << (10 * unit)):.1f} {_BYTE_UNITS[unit]}"
 
-    def format_speed(self, bytes_per_sec):
+    @staticmethod
+    def format_speed(bytes_per_sec):
         """Format network speed"""
-        if bytes_per_sec < 1024:
-            return f"{bytes_per_sec:.0f} B/s"
-        elif bytes_per_sec < 1024 * 1024:
-            return f"{bytes_per_sec/1024:.1f} KB/s"
-        else:
-            return f"{bytes_per_sec/(1024*1024):.1f} MB/s"
+        for limit, multiplier, fmt in _SPEED_UNITS:
+            if bytes_per_sec < limit:
+                break
+        return fmt % (bytes_per_sec * multiplier)
 
     def unified_update(self):
         """Single unified timer for all animations - reduces Windows overhead"""
         if not self._running:
             return
 
-        self._tick_counter += 1
-
-        # Model animation: every tick (100ms = 10fps)
-        if self.frames:
-            self.model_label.config(image=self.frames[self.current_frame])
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-
-        # Code scroll: every 2 ticks (200ms)
-        if self._tick_counter % 2 == 0:
+        now = time.monotonic()
+
+        # Model animation: every 100ms (10fps), paused while the window is
+        # minimized or the model is hidden
+        if now >= self._next_frame_time:
+            if (self.frames and self.root.state() != 'iconic'
+                    and self.model_label.winfo_viewable()):
+                # Flip to the prepared buffer, then fill the other one for the next tick
+                self.model_label.config(image=self.model_photos[self.model_back])
+                self.model_back ^= 1
+                self.current_frame = (self.current_frame + 1) % len(self.frames)
+                self.model_photos[self.model_back].paste(self.frames[self.current_frame])
+            self._next_frame_time = max(self._next_frame_time + 0.1, now)
+
+        # Code scroll: every 200ms
+        if now >= self._next_scroll_time:
             self._update_code_scroll()
+            self._next_scroll_time = max(self._next_scroll_time + 0.2, now)
 
-        # UI stats: every 5 ticks (500ms)
-        if self._tick_counter % 5 == 0:
+        # UI stats: every 500ms
+        if now >= self._next_stats_time:
             self._update_stats_display()
+            self._next_stats_time = max(self._next_stats_time + 0.5, now)
 
-        # Single timer at 100ms base rate
-        self.root.after(100, self.unified_update)
+        # Single timer, woken for whichever task is due next
+        next_due = min(self._next_frame_time, self._next_scroll_time, self._next_stats_time)
+        delay = math.ceil((next_due - time.monotonic()) * 1000)
+        self.root.after(max(delay, 5), self.unified_update)
 
     def _update_code_scroll(self):
         """Update code scroll displays"""
         if not self.code_lines:
             return
 
-        num_labels = len(self.left_code_labels)
+        lines = self.code_lines
+        num_lines = len(lines)
 
         # Left panel - scroll up
+        offset = self.code_scroll_offset_left
         for i, lbl in enumerate(self.left_code_labels):
-            line_idx = (int(self.code_scroll_offset_left) + i) % len(self.code_lines)
-            line = self.code_lines[line_idx][:25]
-            color = '#1a3a4a' if (i < 2 or i > num_labels - 3) else '#00a0c0'
-            lbl.config(text=line, fg=color)
+            lbl.config(text=lines[(offset + i) % num_lines])
 
-        self.code_scroll_offset_left = (self.code_scroll_offset_left + 1) % len(self.code_lines)
+        self.code_scroll_offset_left = (offset + 1) % num_lines
 
         # Right panel - scroll down
+        offset = num_lines - self.code_scroll_offset_right
         for i, lbl in enumerate(self.right_code_labels):
-            line_idx = (len(self.code_lines) - int(self.code_scroll_offset_right) - i) % len(self.code_lines)
-            line = self.code_lines[line_idx][:25]
-            color = '#1a3a4a' if (i < 2 or i > num_labels - 3) else '#00a0c0'
-            lbl.config(text=line, fg=color)
+            lbl.config(text=lines[(offset - i) % num_lines])
+
+        self.code_scroll_offset_right = (self.code_scroll_offset_right + 1) % num_lines
+
+    def _set_text(self, label, text):
+        """Set a label's text, skipping the Tk call (and redraw) when it is unchanged"""
+        if self._label_text.get(label) != text:
+            self._label_text[label] = text
+            label.config(text=text)
+
+    def _format_stats(self, stats):
+        """Build (label, text) pairs for every stats label from a snapshot - no Tk calls"""
+        # CPU - the detail string only changes with the whole-MHz frequency, so reuse it
+        cpu_freq = stats['cpu_freq']
+        cpu_key = (stats['cpu_count'], round(cpu_freq) if cpu_freq else None)
+        if cpu_key != self._cpu_detail_key:
+            self._cpu_detail_key = cpu_key
+            if cpu_freq:
+                self._cpu_detail = f"{stats['cpu_count']} CORES @ {cpu_freq:.0f} MHz"
+            else:
+                self._cpu_detail = f"{stats['cpu_count']} CORES"
 
-        self.code_scroll_offset_right = (self.code_scroll_offset_right + 1) % len(self.code_lines)
+        # Battery
+        if stats['battery_percent'] is not None:
+            status = "+" if stats['battery_plugged'] else ""
+            battery = f"{stats['battery_percent']:.0f}%{status}"
+        else:
+            battery = "AC"
+
+        # Footer clock - the date/hour/minute prefix is rebuilt once a minute
+        now = time.localtime()
+        if now[:5] != self._time_prefix_key:
+            self._time_prefix_key = now[:5]
+            self._time_prefix = time.strftime("SYS.TIME: %Y-%m-%d %H:%M:", now)
+
+        return (
+            (self.cpu_value_label, f"{stats['cpu_percent']:.1f}%"),
+            (self.cpu_detail_label, self._cpu_detail),
+            (self.mem_value_label, f"{stats['mem_percent']:.1f}%"),
+            (self.mem_detail_label, f"{self.format_bytes(stats['mem_used'])} / {self.format_bytes(stats['mem_total'])}"),
+            (self.net_up_label, self.format_speed(stats['net_up_speed'])),
+            (self.net_down_label, self.format_speed(stats['net_down_speed'])),
+            (self.total_tx_label, self.format_bytes(stats['net_total_sent'])),
+            (self.total_rx_label, self.format_bytes(stats['net_total_recv'])),
+            (self.swap_label, f"{stats['swap_percent']}%"),
+            (self.proc_count_label, str(stats['proc_count'])),
+            (self.battery_label, battery),
+            (self.top_proc_label, stats['top_process']),
+            (self.time_label, self._time_prefix + _SECONDS[now.tm_sec]),
+            (self.proc_mem_label, f"PROC.MEM: {self.format_bytes(stats['self_mem'])}"),
+        )
 
     def _update_stats_display(self):
         """Update stats display from background-collected data"""
@@ -886,57 +1193,23 @@ class JarvisMonitor:
             with self._stats_lock:
                 stats = self._stats.copy()
 
-            # CPU
-            cpu_percent = stats['cpu_percent']
-            self.cpu_history.append(cpu_percent)
-            self.draw_arc_gauge(self.cpu_canvas, cpu_percent, color=self.primary)
-            self.cpu_value_label.config(text=f"{cpu_percent:.1f}%")
-            cpu_freq = stats['cpu_freq']
-            if cpu_freq:
-                self.cpu_detail_label.config(text=f"{stats['cpu_count']} CORES @ {cpu_freq:.0f} MHz")
-            else:
-                self.cpu_detail_label.config(text=f"{stats['cpu_count']} CORES")
-
-            # Memory
-            mem_percent = stats['mem_percent']
-            self.mem_history.append(mem_percent)
-            self.draw_arc_gauge(self.mem_canvas, mem_percent, color=self.accent)
-            self.mem_value_label.config(text=f"{mem_percent:.1f}%")
-            self.mem_detail_label.config(text=f"{self.format_bytes(stats['mem_used'])} / {self.format_bytes(stats['mem_total'])}")
-
-            # GPU
-            self.gpu_value_label.config(text=stats['gpu_status'])
-            self.gpu_detail_label.config(text=stats['gpu_info'])
-
-            # Network
-            up_speed = stats['net_up_speed']
-            down_speed = stats['net_down_speed']
-            self.net_up_history.append(up_speed)
-            self.net_down_history.append(down_speed)
-            self.net_up_label.config(text=self.format_speed(up_speed))
-            self.net_down_label.config(text=self.format_speed(down_speed))
-            self.total_tx_label.config(text=self.format_bytes(stats['net_total_sent']))
-            self.total_rx_label.config(text=self.format_bytes(stats['net_total_recv']))
-            self.draw_network_graph()
+            # Build all display values first, so the Tk writes below run back to back
+            texts = self._format_stats(stats)
 
-            # Live stats
-            self.swap_label.config(text=f"{stats['swap_percent']}%")
-            self.proc_count_label.config(text=str(stats['proc_count']))
+            # Histories
+            hist_idx = self._hist_idx
+            self.cpu_history[hist_idx] = round(stats['cpu_percent'])
+            self.mem_history[hist_idx] = round(stats['mem_percent'])
+            self.net_up_history[hist_idx] = min(max(round(stats['net_up_speed']), 0), 0xFFFFFFFF)
+            self.net_down_history[hist_idx] = min(max(round(stats['net_down_speed']), 0), 0xFFFFFFFF)
+            self._hist_idx = (hist_idx + 1) % self.max_data_points
 
-            # Battery
-            if stats['battery_percent'] is not None:
-                status = "+" if stats['battery_plugged'] else ""
-                self.battery_label.config(text=f"{stats['battery_percent']:.0f}%{status}")
-            else:
-                self.battery_label.config(text="AC")
-
-            # Top process
-            self.top_proc_label.config(text=stats['top_process'])
-
-            # Footer
-            now = datetime.now()
-            self.time_label.config(text=now.strftime("SYS.TIME: %Y-%m-%d %H:%M:%S"))
-            self.proc_mem_label.config(text=f"PROC.MEM: {self.format_bytes(stats['self_mem'])}")
+            # Apply
+            self.update_arc_gauge(self.cpu_canvas, self.cpu_gauge_ids, stats['cpu_percent'], color=self.primary)
+            self.update_arc_gauge(self.mem_canvas, self.mem_gauge_ids, stats['mem_percent'], color=self.accent)
+            self.draw_network_graph()
+            for label, text in texts:
+                self._set_text(label, text)
 
         except Exception as e:
             print(f"Stats display error: {e}")
@@ -2,6 +2,7 @@
 """Test script to verify imports and basic functionality"""
 
 import sys
+import time
 import psutil
 from collections import deque
 
@@ -9,7 +10,9 @@ print("Testing imports and basic functionality...")
 
 # Test psutil
 print(f"✓ psutil version: {psutil.__version__}")
-print(f"  CPU: {psutil.cpu_percent(interval=0.5)}%")
+psutil.cpu_percent(interval=None)  # Prime the non-blocking sampler
+time.sleep(0.05)
+print(f"  CPU: {psutil.cpu_percent(interval=None)}%")
 print(f"  Memory: {psutil.virtual_memory().percent}%")
 
 # Test deque